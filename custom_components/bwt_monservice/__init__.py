@@ -9,9 +9,18 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.util.ssl import get_default_context
 
 from .api import BWTApiClient
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, REQUEST_TIMEOUT
+from .const import (
+    CONNECTION_LIMIT,
+    CONNECTION_LIMIT_PER_HOST,
+    DEFAULT_SCAN_INTERVAL,
+    DNS_CACHE_TTL,
+    DOMAIN,
+    KEEPALIVE_TIMEOUT,
+    REQUEST_TIMEOUT,
+)
 from .coordinator import BWTDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -39,11 +48,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
     session = aiohttp.ClientSession(
         timeout=timeout,
-        connector=aiohttp.TCPConnector(ssl=False),
+        connector=aiohttp.TCPConnector(
+            ssl=get_default_context(),
+            limit=CONNECTION_LIMIT,
+            limit_per_host=CONNECTION_LIMIT_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ),
         cookie_jar=aiohttp.CookieJar(unsafe=True),
-        headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-        },
     )
 
     # Create API client with persistent session
@@ -72,6 +84,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass,
         api_client,
         scan_interval,
+        entry,
     )
 
     # Fetch initial data
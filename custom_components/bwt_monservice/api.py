@@ -1,21 +1,67 @@
 """API client for BWT MyService with persistent session."""
 import asyncio
 import logging
+import re
+import time
 from datetime import datetime, timezone
+from html import unescape
 from typing import Any
 
 import aiohttp
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+import orjson
 
 from .const import (
     AJAX_URL,
+    BACKOFF_BASE_DELAY,
+    BACKOFF_MAX_DELAY,
     DASHBOARD_URL,
     DEVICE_URL,
+    HTML_CACHE_TTL,
     LOGIN_URL,
+    USER_AGENT,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sent per request: sessions may carry a different default User-Agent
+_REQUEST_HEADERS = {"User-Agent": USER_AGENT}
+
+# Device history column codes mapped to coordinator data keys
+_HISTORY_CODE_MAP = {
+    "date": "data_date",
+    "regenCount": "regen_count",
+    "powerOutage": "power_outage",
+    "waterUse": "water_use",
+    "saltAlarm": "salt_alarm",
+}
+
+# receiptLineKey query parameter, matched directly on the raw dashboard bytes
+_RECEIPT_KEY_RE = re.compile(rb'receiptLineKey=([^&"\'<>\s]+)')
+
+# Device page fields, matched directly on the decoded HTML. Class attributes are
+# matched on whole tokens, like the XPath expressions below.
+_DEVICE_NAME_RE = re.compile(
+    r'<h1(?:\s[^>]*)?\sclass="(?:[^"]*\s)?page-title(?:\s[^"]*)?"[^>]*>(.*?)</h1>', re.S
+)
+_INFO_BLOCK_RE = re.compile(
+    r'<div(?:\s[^>]*)?\sclass="(?:[^"]*\s)?informations(?:\s[^"]*)?"[^>]*>(.*?)</div>', re.S
+)
+# Serial: whole text up to the closing span, as the span text would give
+_SERIAL_RE = re.compile(r"N°\s*série\s*:([^<]*)</span>")
+_SERVICE_DATE_RE = re.compile(r"Mise en service le\s*(?:<[^>]+>\s*)*(\d{2})-(\d{2})-(\d{4})")
+# Fields the device page must yield before its result is cached
+_DEVICE_INFO_KEYS = frozenset({"device_name", "serial_number", "service_date"})
+
+# XPath expressions compiled once at import and reused on every parse
+_RECEIPT_LINK_XPATH = etree.XPath('//a[contains(@href, "receiptLineKey=")]/@href')
+_DEVICE_NAME_XPATH = etree.XPath(
+    '//h1[contains(concat(" ", normalize-space(@class), " "), " page-title ")]'
+)
+_INFO_SPANS_XPATH = etree.XPath(
+    '(//div[contains(concat(" ", normalize-space(@class), " "), " informations ")])[1]//span'
+)
+
 
 class AuthenticationError(Exception):
     """Exception raised for authentication errors."""
@@ -29,6 +75,103 @@ class DataNotFoundError(Exception):
     """Exception raised when data is not found."""
 
 
+class ServerOverloadError(ConnectionError):
+    """Exception raised when the server reports an overload (HTTP 500)."""
+
+
+def _parse_html(body: bytes) -> etree._Element:
+    """Parse a raw UTF-8 HTML document into an lxml tree.
+
+    Raises:
+        DataNotFoundError: If the document is empty
+    """
+    # BWT pages are UTF-8; without an explicit encoding lxml assumes Latin-1
+    # for pages that don't declare a charset. A parser is created per call
+    # because parsing runs in executor threads.
+    try:
+        return lxml_html.document_fromstring(body, parser=lxml_html.HTMLParser(encoding="utf-8"))
+    except etree.ParserError as err:
+        raise DataNotFoundError(f"Empty HTML document: {err}") from err
+
+
+def _element_text(element: etree._Element) -> str:
+    """Return the stripped text content of an element."""
+    return "".join(part.strip() for part in element.itertext())
+
+
+def _match_device_info(html: str) -> dict[str, Any]:
+    """Match device name, serial number and service date in the raw device page.
+
+    Uses precompiled regexes on the same elements as _parse_device_info; fields
+    that are not matched, or whose markup is too nested to match reliably, are
+    left out.
+    """
+    data: dict[str, Any] = {}
+
+    # First page-title heading only, and only when it holds plain text
+    name_match = _DEVICE_NAME_RE.search(html)
+    if name_match and "<" not in name_match.group(1):
+        data["device_name"] = unescape(name_match.group(1)).strip()
+
+    # Serial number and service date only inside the first informations div,
+    # unless it contains nested divs the non-greedy match would cut short
+    info_match = _INFO_BLOCK_RE.search(html)
+    if info_match is None or "<div" in info_match.group(1):
+        return data
+    info_html = info_match.group(1)
+
+    # Last match wins, as in the span loop of the document parse
+    if serial_matches := _SERIAL_RE.findall(info_html):
+        # Same extraction as the span text path: "N° série : 08K8-FJKL" -> "08K8-FJKL"
+        data["serial_number"] = unescape(serial_matches[-1]).split(":")[-1].strip()
+    if date_matches := _SERVICE_DATE_RE.findall(info_html):
+        day, month, year = date_matches[-1]
+        data["service_date"] = f"{year}-{month}-{day}"
+
+    return data
+
+
+def _parse_receipt_link_hrefs(body: bytes) -> list[str]:
+    """Parse the dashboard and return hrefs of links containing receiptLineKey."""
+    return [str(href) for href in _RECEIPT_LINK_XPATH(_parse_html(body))]
+
+
+def _parse_device_info(body: bytes) -> dict[str, Any]:
+    """Parse device name, serial number and service date from the device page."""
+    try:
+        tree = _parse_html(body)
+    except DataNotFoundError:
+        # An empty device page must not fail the poll: AJAX data is still valid
+        _LOGGER.debug("Device page is empty, no device info extracted")
+        return {}
+
+    data: dict[str, Any] = {}
+
+    # Extract device name
+    device_name_elems = _DEVICE_NAME_XPATH(tree)
+    if device_name_elems:
+        data["device_name"] = _element_text(device_name_elems[0])
+
+    # Extract serial number and service date from informations div spans
+    for span in _INFO_SPANS_XPATH(tree):
+        text = _element_text(span)
+        if "N° série" in text:
+            # Extract serial: "N° série : 08K8-FJKL" -> "08K8-FJKL"
+            data["serial_number"] = text.split(":")[-1].strip()
+        elif "Mise en service le" in text:
+            # Extract date: "Mise en service le 04-06-2024" -> "04-06-2024"
+            date_str = text.split("le")[-1].strip()
+            # Convert DD-MM-YYYY to YYYY-MM-DD for date.fromisoformat()
+            try:
+                day, month, year = date_str.split("-")
+                data["service_date"] = f"{year}-{month}-{day}"
+            except ValueError:
+                _LOGGER.debug("Failed to parse service_date: %s", date_str)
+                data["service_date"] = date_str
+
+    return data
+
+
 class BWTApiClient:
     """API client for BWT MyService with persistent session."""
 
@@ -40,9 +183,22 @@ class BWTApiClient:
         """
         self._session = session
         self._receipt_line_key: str | None = None
+        # Device URLs and AJAX headers derived once from the receipt line key
+        self._ajax_url: str | None = None
+        self._device_url: str | None = None
+        self._ajax_headers: dict[str, str] = {}
         self._is_authenticated: bool = False
         self._username: str | None = None
         self._password: str | None = None
+        self._auth_lock = asyncio.Lock()
+        # Client-side backoff after consecutive server overloads (HTTP 500)
+        self._backoff_until: float = 0.0
+        self._consecutive_500s: int = 0
+        # Validators and last parsed result of the device page (conditional GET)
+        self._html_etag: str | None = None
+        self._html_last_modified: str | None = None
+        self._html_cached: dict[str, Any] | None = None
+        self._html_expires_at: float = 0.0
 
     async def authenticate(self, username: str, password: str) -> bool:
         """Authenticate with BWT MyService and store credentials.
@@ -68,7 +224,7 @@ class BWTApiClient:
             # First, visit the login page to get any necessary cookies/tokens
             try:
                 _LOGGER.debug("Fetching login page: %s", LOGIN_URL)
-                async with self._session.get(LOGIN_URL) as response:
+                async with self._session.get(LOGIN_URL, headers=_REQUEST_HEADERS) as response:
                     _LOGGER.debug("Login page status: %s", response.status)
             except Exception as err:
                 _LOGGER.debug("Error fetching login page (continuing anyway): %s", err)
@@ -82,7 +238,9 @@ class BWTApiClient:
             _LOGGER.debug("Posting login credentials to: %s", LOGIN_URL)
 
             # Perform login
-            async with self._session.post(LOGIN_URL, data=data, allow_redirects=True) as response:
+            async with self._session.post(
+                LOGIN_URL, data=data, headers=_REQUEST_HEADERS, allow_redirects=True
+            ) as response:
                 final_url = str(response.url)
                 status = response.status
                 _LOGGER.debug("Login response status: %s, final URL: %s", status, final_url)
@@ -91,16 +249,16 @@ class BWTApiClient:
                     _LOGGER.error("Login failed with status %s", status)
                     raise AuthenticationError(f"Login failed with status {status}")
 
-                # Get response text for debugging
-                text = await response.text()
-                _LOGGER.debug("Response text length: %d characters", len(text))
-
                 # Check if we were redirected to dashboard (successful login)
                 if "dashboard" in final_url:
                     self._is_authenticated = True
                     _LOGGER.info("Authentication successful (redirected to dashboard)")
                     return True
 
+                # Body is only needed when the redirect check is inconclusive
+                text = (await response.read()).decode("utf-8", errors="replace")
+                _LOGGER.debug("Response text length: %d characters", len(text))
+
                 # Check response content for error messages
                 text_lower = text.lower()
                 if "identifiants invalides" in text_lower or "invalid credentials" in text_lower:
@@ -135,11 +293,20 @@ class BWTApiClient:
         Raises:
             AuthenticationError: If re-authentication fails
         """
-        if not self._is_authenticated:
+        if self._is_authenticated:
+            return
+
+        # Single-flight: concurrent callers wait for one login instead of each logging in
+        async with self._auth_lock:
+            if self._is_authenticated:
+                return
+
             if not self._username or not self._password:
                 raise AuthenticationError("No credentials stored for re-authentication")
 
             _LOGGER.warning("Session expired, re-authenticating...")
+            # Force the device page to be revalidated after a new login
+            self._html_expires_at = 0.0
             await self.authenticate(self._username, self._password)
 
     async def get_receipt_line_key(self) -> str:
@@ -163,40 +330,46 @@ class BWTApiClient:
         try:
             _LOGGER.debug("Fetching dashboard to extract receipt line key")
 
-            async with self._session.get(DASHBOARD_URL) as response:
+            async with self._session.get(DASHBOARD_URL, headers=_REQUEST_HEADERS) as response:
                 # Handle authentication failures
                 if response.status in (401, 403):
                     _LOGGER.warning("Dashboard returned %s, session expired - re-authenticating", response.status)
                     self._is_authenticated = False
                     await self._ensure_authenticated()
                     # Retry after re-authentication
-                    async with self._session.get(DASHBOARD_URL) as retry_response:
+                    async with self._session.get(DASHBOARD_URL, headers=_REQUEST_HEADERS) as retry_response:
                         if retry_response.status != 200:
                             raise ConnectionError(f"Failed to fetch dashboard after re-auth: {retry_response.status}")
-                        html = await retry_response.text()
+                        body = await retry_response.read()
                 elif response.status == 500:
                     _LOGGER.warning("Dashboard returned 500 (server overload)")
-                    raise ConnectionError("Server overload (500)")
+                    raise ServerOverloadError("Server overload (500)")
                 elif response.status != 200:
                     raise ConnectionError(f"Failed to fetch dashboard: {response.status}")
                 else:
-                    html = await response.text()
+                    body = await response.read()
 
-                soup = BeautifulSoup(html, "lxml")
+                # Fast path: scan the raw bytes for the query parameter
+                match = _RECEIPT_KEY_RE.search(body)
+                if match:
+                    key = match.group(1).decode("utf-8", errors="replace")
+                    self._set_receipt_line_key(key)
+                    return key
 
-                # Find link with href containing receiptLineKey
-                device_link = soup.find("a", href=lambda x: x and "receiptLineKey=" in x)
+                _LOGGER.debug("receiptLineKey not matched in raw dashboard, parsing HTML")
+                # Find link with href containing receiptLineKey (full parse, off the event loop)
+                hrefs = await asyncio.get_running_loop().run_in_executor(
+                    None, _parse_receipt_link_hrefs, body
+                )
 
-                if not device_link:
+                if not hrefs:
                     raise DataNotFoundError("No device found in dashboard")
 
                 # Extract receiptLineKey from href
-                href = device_link.get("href")
+                href = hrefs[0]
                 if "receiptLineKey=" in href:
                     key = href.split("receiptLineKey=")[1].split("&")[0]
-                    # Cache the key for future use
-                    self._receipt_line_key = key
-                    _LOGGER.info("Receipt line key extracted and cached: %s", key)
+                    self._set_receipt_line_key(key)
                     return key
 
                 raise DataNotFoundError("Receipt line key not found in link")
@@ -208,6 +381,18 @@ class BWTApiClient:
         except asyncio.TimeoutError as err:
             raise ConnectionError("Timeout fetching dashboard") from err
 
+    def _set_receipt_line_key(self, key: str) -> None:
+        """Cache the receipt line key and the device URLs derived from it."""
+        self._receipt_line_key = key
+        self._ajax_url = f"{AJAX_URL}?receiptLineKey={key}"
+        self._device_url = f"{DEVICE_URL}?receiptLineKey={key}"
+        self._ajax_headers = {
+            **_REQUEST_HEADERS,
+            "X-Requested-With": "XMLHttpRequest",
+            "Referer": self._device_url,
+        }
+        _LOGGER.info("Receipt line key extracted and cached: %s", key)
+
     async def get_device_data(self) -> dict[str, Any]:
         """Fetch all device data using persistent session.
 
@@ -218,6 +403,27 @@ class BWTApiClient:
             AuthenticationError: If authentication fails
             ConnectionError: If connection fails
         """
+        # Don't hit an overloaded server again before the backoff delay expires
+        remaining = self._backoff_until - time.monotonic()
+        if remaining > 0:
+            raise ConnectionError(f"Server overloaded, backing off for {remaining:.0f}s")
+
+        try:
+            data = await self._fetch_device_data()
+        except ServerOverloadError:
+            # Count one overload per poll, even if both endpoints returned 500
+            self._register_server_overload()
+            raise
+
+        self._consecutive_500s = 0
+        return data
+
+    async def _fetch_device_data(self) -> dict[str, Any]:
+        """Fetch device data, re-authenticating once if the session expired.
+
+        Returns:
+            Dictionary containing device data
+        """
         await self._ensure_authenticated()
 
         # Ensure we have the receipt line key
@@ -225,28 +431,52 @@ class BWTApiClient:
             await self.get_receipt_line_key()
 
         try:
-            # Fetch AJAX data (real-time data: consumption, regenerations, alarms)
-            ajax_data = await self._fetch_ajax_data()
+            return await self._fetch_all_data()
 
-            # Fetch HTML data (configuration: hardness, pressure, holiday mode, serial, etc.)
-            html_data = await self._fetch_html_data()
+        except AuthenticationError:
+            # Session expired on either endpoint: re-authenticate once and retry both
+            _LOGGER.warning("Session expired during data fetch, re-authenticating...")
+            self._is_authenticated = False
+            await self._ensure_authenticated()
 
-            # Merge both data sources (HTML data won't overwrite AJAX data)
-            html_data.update(ajax_data)
+            return await self._fetch_all_data()
 
-            return html_data
+    def _register_server_overload(self) -> None:
+        """Schedule an exponential backoff after the server returned 500."""
+        delay = min(BACKOFF_MAX_DELAY, BACKOFF_BASE_DELAY * 2**self._consecutive_500s)
+        self._consecutive_500s += 1
+        self._backoff_until = time.monotonic() + delay
+        _LOGGER.warning("Server overloaded, backing off for %d seconds", delay)
 
-        except aiohttp.ClientError as err:
-            # Check if it's an authentication error
-            if "401" in str(err) or "403" in str(err):
-                _LOGGER.warning("Session expired during data fetch, re-authenticating...")
-                self._is_authenticated = False
-                await self._ensure_authenticated()
+    async def _fetch_all_data(self) -> dict[str, Any]:
+        """Fetch AJAX and HTML data concurrently and merge them.
 
-                # Retry after re-authentication
-                return await self._fetch_ajax_data()
+        Both requests go to the same host over the persistent session, so
+        they are issued in parallel instead of one after the other. If one
+        fails, the other is cancelled so a failed poll leaves no request running.
+
+        Returns:
+            Dictionary containing merged device data
+        """
+        # AJAX: real-time data (consumption, regenerations, alarms)
+        # HTML: device info (name, serial number, service date)
+        tasks = (
+            asyncio.create_task(self._fetch_ajax_data()),
+            asyncio.create_task(self._fetch_html_data()),
+        )
+        try:
+            ajax_data, html_data = await asyncio.gather(*tasks)
+        except Exception:
+            for task in tasks:
+                task.cancel()
+            # Wait for the cancellation to complete before reporting the failure
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
-            raise ConnectionError(f"Error fetching device data: {err}") from err
+        # Merge both data sources (HTML data won't overwrite AJAX data)
+        html_data.update(ajax_data)
+
+        return html_data
 
     async def _fetch_ajax_data(self) -> dict[str, Any]:
         """Fetch JSON data from AJAX endpoint.
@@ -255,36 +485,35 @@ class BWTApiClient:
             Dictionary containing AJAX data
 
         Raises:
+            AuthenticationError: If the session has expired
             ConnectionError: If request fails
             DataNotFoundError: If data structure is invalid
         """
-        url = f"{AJAX_URL}?receiptLineKey={self._receipt_line_key}"
+        url = self._ajax_url
 
         try:
             _LOGGER.debug("Fetching AJAX data (POST): %s", url)
 
-            headers = {
-                "X-Requested-With": "XMLHttpRequest",
-                "Referer": f"{DEVICE_URL}?receiptLineKey={self._receipt_line_key}",
-            }
-
-            async with self._session.post(url, headers=headers) as response:
+            async with self._session.post(url, headers=self._ajax_headers) as response:
                 _LOGGER.debug("AJAX response status: %s", response.status)
 
                 # Handle authentication failures
                 if response.status in (401, 403):
                     _LOGGER.warning("AJAX endpoint returned %s - session expired", response.status)
-                    raise aiohttp.ClientError(f"Session expired: {response.status}")
+                    raise AuthenticationError(f"Session expired: {response.status}")
 
                 if response.status == 500:
                     _LOGGER.warning("AJAX endpoint returned 500 (server overload)")
-                    raise ConnectionError("Server overload (500)")
+                    raise ServerOverloadError("Server overload (500)")
 
                 if response.status != 200:
                     _LOGGER.error("Failed to fetch AJAX data: status %s", response.status)
                     raise ConnectionError(f"Failed to fetch AJAX data: {response.status}")
 
-                json_data = await response.json()
+                try:
+                    json_data = orjson.loads(await response.read())
+                except orjson.JSONDecodeError as err:
+                    raise DataNotFoundError(f"Invalid JSON response: {err}") from err
                 _LOGGER.debug("JSON response keys: %s", list(json_data.keys()) if isinstance(json_data, dict) else type(json_data))
 
                 if "dataset" not in json_data:
@@ -315,13 +544,11 @@ class BWTApiClient:
                 # Extract last seen datetime
                 last_seen = dataset.get("lastSeenDateTime")
                 if last_seen:
-                    try:
-                        # Parse ISO format datetime
-                        dt = datetime.fromisoformat(last_seen.replace("Z", "+00:00"))
-                        data["last_seen"] = dt.isoformat()
-                    except ValueError:
-                        _LOGGER.debug("Failed to parse last_seen datetime: %s", last_seen)
-                        data["last_seen"] = last_seen
+                    # Keep the ISO string as is, only normalizing a "Z" suffix;
+                    # the sensor platform parses it into a datetime
+                    if isinstance(last_seen, str) and last_seen.endswith("Z"):
+                        last_seen = last_seen[:-1] + "+00:00"
+                    data["last_seen"] = last_seen
 
                 # Extract device history data (only first line = today)
                 history = dataset.get("deviceDataHistory", {})
@@ -336,8 +563,9 @@ class BWTApiClient:
                     for line in lines:
                         if not line:
                             continue
-                        first_col = str(line[0])
-                        if first_col.startswith(today_str):
+                        first_col = line[0]
+                        # Only string dates can match; compare the YYYY-MM-DD prefix directly
+                        if isinstance(first_col, str) and first_col[:10] == today_str:
                             today_data = line
                             break
 
@@ -351,20 +579,10 @@ class BWTApiClient:
                         data["salt_alarm"] = 0
                     else:
                         # Map codes to values from today's line
-                        for i, code in enumerate(codes):
-                            if i < len(today_data):
-                                value = today_data[i]
-
-                                if code == "date":
-                                    data["data_date"] = value
-                                elif code == "regenCount":
-                                    data["regen_count"] = value
-                                elif code == "powerOutage":
-                                    data["power_outage"] = value
-                                elif code == "waterUse":
-                                    data["water_use"] = value
-                                elif code == "saltAlarm":
-                                    data["salt_alarm"] = value
+                        for code, value in zip(codes, today_data):
+                            key = _HISTORY_CODE_MAP.get(code)
+                            if key is not None:
+                                data[key] = value
 
                 _LOGGER.debug("AJAX data extracted: %s", data)
                 return data
@@ -381,67 +599,85 @@ class BWTApiClient:
 
         Extracts only device name, serial number, and service date.
         Configuration parameters (hardness, pressure, etc.) are no longer
-        available due to website changes.
+        available due to website changes. The result is cached for
+        HTML_CACHE_TTL seconds since these values practically never change.
 
         Returns:
             Dictionary containing device name, serial number, and service date
 
         Raises:
+            AuthenticationError: If the session has expired
             ConnectionError: If request fails
             DataNotFoundError: If data structure is invalid
         """
-        url = f"{DEVICE_URL}?receiptLineKey={self._receipt_line_key}"
+        if (
+            self._html_cached is not None
+            and time.monotonic() < self._html_expires_at
+        ):
+            _LOGGER.debug("Using cached HTML data")
+            return dict(self._html_cached)
+
+        url = self._device_url
 
         try:
             _LOGGER.debug("Fetching HTML data: %s", url)
 
-            async with self._session.get(url) as response:
+            # Revalidate the previously parsed page instead of downloading it again
+            headers = dict(_REQUEST_HEADERS)
+            if self._html_cached is not None:
+                if self._html_etag:
+                    headers["If-None-Match"] = self._html_etag
+                if self._html_last_modified:
+                    headers["If-Modified-Since"] = self._html_last_modified
+
+            async with self._session.get(url, headers=headers) as response:
                 _LOGGER.debug("HTML response status: %s", response.status)
 
+                if response.status == 304 and self._html_cached is not None:
+                    _LOGGER.debug("HTML data not modified, using cached data")
+                    self._html_expires_at = time.monotonic() + HTML_CACHE_TTL
+                    return dict(self._html_cached)
+
                 # Handle authentication failures
                 if response.status in (401, 403):
                     _LOGGER.warning("HTML endpoint returned %s - session expired", response.status)
-                    raise aiohttp.ClientError(f"Session expired: {response.status}")
+                    raise AuthenticationError(f"Session expired: {response.status}")
 
                 if response.status == 500:
                     _LOGGER.warning("HTML endpoint returned 500 (server overload)")
-                    raise ConnectionError("Server overload (500)")
+                    raise ServerOverloadError("Server overload (500)")
 
                 if response.status != 200:
                     _LOGGER.error("Failed to fetch HTML data: status %s", response.status)
                     raise ConnectionError(f"Failed to fetch HTML data: {response.status}")
 
-                html = await response.text()
-                soup = BeautifulSoup(html, "lxml")
+                # BWT pages are UTF-8: decode directly instead of charset sniffing.
+                # The regexes run on the decoded copy, lxml gets the raw bytes.
+                body = await response.read()
+                data = _match_device_info(body.decode("utf-8", errors="replace"))
+                if not _DEVICE_INFO_KEYS.issubset(data):
+                    # Full parse blocks for a while on large pages: run it off the event loop
+                    _LOGGER.debug("Device info not fully matched in raw HTML, parsing document")
+                    parsed = await asyncio.get_running_loop().run_in_executor(
+                        None, _parse_device_info, body
+                    )
+                    # Keep fields only the fast path matched; the parse wins otherwise
+                    data.update(parsed)
 
-                data = {}
+                _LOGGER.debug("HTML data extracted: %s", data)
 
-                # Extract device name
-                device_name_elem = soup.find("h1", class_="page-title")
-                if device_name_elem:
-                    data["device_name"] = device_name_elem.get_text(strip=True)
-
-                # Extract serial number and service date from informations div
-                info_div = soup.find("div", class_="informations")
-                if info_div:
-                    spans = info_div.find_all("span")
-                    for span in spans:
-                        text = span.get_text(strip=True)
-                        if "N° série" in text:
-                            # Extract serial: "N° série : 08K8-FJKL" -> "08K8-FJKL"
-                            data["serial_number"] = text.split(":")[-1].strip()
-                        elif "Mise en service le" in text:
-                            # Extract date: "Mise en service le 04-06-2024" -> "04-06-2024"
-                            date_str = text.split("le")[-1].strip()
-                            # Convert DD-MM-YYYY to YYYY-MM-DD for date.fromisoformat()
-                            try:
-                                day, month, year = date_str.split("-")
-                                data["service_date"] = f"{year}-{month}-{day}"
-                            except ValueError:
-                                _LOGGER.debug("Failed to parse service_date: %s", date_str)
-                                data["service_date"] = date_str
+                if not _DEVICE_INFO_KEYS.issubset(data):
+                    # Maintenance or partial page: don't cache it for a whole TTL
+                    if self._html_cached is not None:
+                        _LOGGER.debug("Incomplete device info, keeping previous data")
+                        return dict(self._html_cached)
+                    return data
+
+                self._html_etag = response.headers.get("ETag")
+                self._html_last_modified = response.headers.get("Last-Modified")
+                self._html_cached = dict(data)
+                self._html_expires_at = time.monotonic() + HTML_CACHE_TTL
 
-                _LOGGER.debug("HTML data extracted: %s", data)
                 return data
 
         except (ConnectionError, DataNotFoundError):
@@ -459,7 +695,5 @@ class BWTApiClient:
         """
         if self._session and not self._session.closed:
             _LOGGER.info("Closing BWT MyService session")
+            # ClientSession.close() awaits the connector shutdown on aiohttp >= 3.8
             await self._session.close()
-            # Allow 250ms for aiohttp to complete SSL shutdown and connection cleanup
-            # Recommended by aiohttp docs to prevent "Unclosed client session" warnings
-            await asyncio.sleep(0.25)
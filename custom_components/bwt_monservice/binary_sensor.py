@@ -1,10 +1,8 @@
 """Binary sensor platform for BWT MyService."""
 from __future__ import annotations
 
-from collections.abc import Callable
 from dataclasses import dataclass
 import logging
-from typing import Any
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -12,23 +10,20 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER
+from .const import DOMAIN
 from .coordinator import BWTDataUpdateCoordinator
+from .entity import BWTEntity, BWTEntityDescription
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
-class BWTBinarySensorEntityDescription(BinarySensorEntityDescription):
+@dataclass(frozen=True, kw_only=True)
+class BWTBinarySensorEntityDescription(BinarySensorEntityDescription, BWTEntityDescription):
     """Describes BWT binary sensor entity."""
 
-    value_fn: Callable[[dict[str, Any]], bool | None] = lambda data: None
-
 
 BINARY_SENSORS: tuple[BWTBinarySensorEntityDescription, ...] = (
     BWTBinarySensorEntityDescription(
@@ -36,35 +31,35 @@ BINARY_SENSORS: tuple[BWTBinarySensorEntityDescription, ...] = (
         translation_key="connected",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         icon="mdi:wifi",
-        value_fn=lambda data: data.get("connected"),
+        data_key="connected",
     ),
     BWTBinarySensorEntityDescription(
         key="online",
         translation_key="online",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         icon="mdi:check-network",
-        value_fn=lambda data: data.get("online"),
+        data_key="online",
     ),
     BWTBinarySensorEntityDescription(
         key="connectable",
         translation_key="connectable",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         icon="mdi:network",
-        value_fn=lambda data: data.get("connectable"),
+        data_key="connectable",
     ),
     BWTBinarySensorEntityDescription(
         key="power_outage",
         translation_key="power_outage",
         device_class=BinarySensorDeviceClass.PROBLEM,
         icon="mdi:power-plug-off",
-        value_fn=lambda data: data.get("power_outage"),
+        data_key="power_outage",
     ),
     BWTBinarySensorEntityDescription(
         key="salt_alarm",
         translation_key="salt_alarm",
         device_class=BinarySensorDeviceClass.PROBLEM,
         icon="mdi:alert",
-        value_fn=lambda data: data.get("salt_alarm"),
+        data_key="salt_alarm",
     ),
 )
 
@@ -78,8 +73,8 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator: BWTDataUpdateCoordinator = data["coordinator"]
 
-    # Create device info
-    device_info = _get_device_info(coordinator, entry)
+    # Device info is built once by the coordinator on its first refresh
+    device_info = coordinator.device_info
 
     # Create binary sensor entities
     entities = [
@@ -90,65 +85,15 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-def _get_device_info(coordinator: BWTDataUpdateCoordinator, entry: ConfigEntry) -> dict[str, Any]:
-    """Get device info from coordinator data."""
-    data = coordinator.data
-    device_name = data.get("device_name", "BWT Device")
-    serial_number = data.get("serial_number", "unknown")
-
-    # Extract model from device name if possible
-    model = None
-    if "MY PERLA" in device_name.upper():
-        model = "MY PERLA OPTIMUM"
-    elif device_name:
-        # Use device name as model if it's not the default
-        model = device_name if device_name != "BWT Device" else None
-
-    # Get optional host for configuration_url
-    host = entry.data.get(CONF_HOST)
-
-    device_info = {
-        "identifiers": {(DOMAIN, serial_number)},
-        "name": device_name,
-        "manufacturer": MANUFACTURER,
-        "model": model,
-        "serial_number": serial_number,
-    }
-
-    # Add configuration_url if host is provided
-    if host:
-        device_info["configuration_url"] = f"http://{host}"
-
-    return device_info
-
-
-class BWTBinarySensor(CoordinatorEntity[BWTDataUpdateCoordinator], BinarySensorEntity):
+class BWTBinarySensor(BWTEntity, BinarySensorEntity):
     """Representation of a BWT binary sensor."""
 
     entity_description: BWTBinarySensorEntityDescription
 
-    def __init__(
-        self,
-        coordinator: BWTDataUpdateCoordinator,
-        description: BWTBinarySensorEntityDescription,
-        device_info: dict[str, Any],
-    ) -> None:
-        """Initialize the binary sensor."""
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._attr_device_info = device_info
-
-        # Set unique ID
-        serial_number = device_info.get("serial_number", "unknown")
-        self._attr_unique_id = f"{serial_number}_{description.key}"
-
-        # Set entity ID
-        self._attr_has_entity_name = True
-
     @property
     def is_on(self) -> bool | None:
         """Return true if the binary sensor is on."""
-        return self.entity_description.value_fn(self.coordinator.data)
+        return self.coordinator.data.get(self.entity_description.data_key)
 
     @property
     def available(self) -> bool:
@@ -157,5 +102,4 @@ class BWTBinarySensor(CoordinatorEntity[BWTDataUpdateCoordinator], BinarySensorE
             return False
 
         # Check if the value exists in coordinator data
-        value = self.entity_description.value_fn(self.coordinator.data)
-        return value is not None
+        return self.coordinator.data.get(self.entity_description.data_key) is not None
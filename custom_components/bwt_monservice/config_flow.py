@@ -10,7 +10,7 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_SCAN_INTERVAL, CONF_USERNAME
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
-import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
 
 from .api import AuthenticationError, BWTApiClient, ConnectionError as BWTConnectionError
 from .const import (
@@ -23,6 +23,24 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Form schemas are built once at import and reused on every render
+USER_STEP_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_USERNAME): str,
+        vol.Required(CONF_PASSWORD): str,
+        vol.Optional(CONF_HOST, default=""): str,
+    }
+)
+
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_SCAN_INTERVAL): vol.All(
+            vol.Coerce(int),
+            vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
+        ),
+    }
+)
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
@@ -40,15 +58,16 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
     """
     _LOGGER.debug("Validating user input for BWT MyService")
 
-    # Create temporary session for validation
+    # Create temporary session for validation on Home Assistant's pooled connector,
+    # with its own cookie jar so the login cookies stay private to this flow.
+    # HA sets its own User-Agent on this session; BWTApiClient sends the
+    # browser User-Agent on each request instead.
     timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT)
-    session = aiohttp.ClientSession(
+    session = async_create_clientsession(
+        hass,
+        auto_cleanup=False,
         timeout=timeout,
-        connector=aiohttp.TCPConnector(ssl=False),
         cookie_jar=aiohttp.CookieJar(unsafe=True),
-        headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-        },
     )
 
     api_client = BWTApiClient(session)
@@ -71,11 +90,12 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
             "receipt_line_key": receipt_line_key,  # Use for unique_id only
         }
 
-    except Exception as err:
-        _LOGGER.error("Error validating input: %s", err, exc_info=True)
+    except Exception:
+        # The caller logs a user-relevant message; keep the traceback at debug level
+        _LOGGER.debug("Error validating input", exc_info=True)
         raise
     finally:
-        # Always close the temporary session
+        # Close the temporary session; the shared connector is not owned by it
         await session.close()
 
 
@@ -125,17 +145,9 @@ class BWTConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
 
         # Show form
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_USERNAME): str,
-                vol.Required(CONF_PASSWORD): str,
-                vol.Optional(CONF_HOST, default=""): str,
-            }
-        )
-
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=USER_STEP_SCHEMA,
             errors=errors,
         )
 
@@ -155,28 +167,21 @@ class BWTOptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
-        if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
-
         # Get current scan interval or use default
         # Access options via config_entry which is set by the framework
         current_interval = self.config_entry.options.get(
             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
         )
 
-        data_schema = vol.Schema(
-            {
-                vol.Optional(
-                    CONF_SCAN_INTERVAL,
-                    default=current_interval,
-                ): vol.All(
-                    cv.positive_int,
-                    vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
-                ),
-            }
-        )
+        if user_input is not None:
+            # A cleared field is omitted from user_input: keep the current interval
+            return self.async_create_entry(
+                title="", data={CONF_SCAN_INTERVAL: current_interval, **user_input}
+            )
 
         return self.async_show_form(
             step_id="init",
-            data_schema=data_schema,
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, {CONF_SCAN_INTERVAL: current_interval}
+            ),
         )
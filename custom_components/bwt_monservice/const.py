@@ -15,8 +15,24 @@ DEFAULT_SCAN_INTERVAL = 10  # minutes
 MIN_SCAN_INTERVAL = 5
 MAX_SCAN_INTERVAL = 1440
 
+# Browser User-Agent sent with every request to the BWT site
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
 # Timeout settings
 REQUEST_TIMEOUT = 30  # seconds
 
+# Backoff after server overload (HTTP 500)
+BACKOFF_BASE_DELAY = 30  # seconds, doubled on each consecutive overload
+BACKOFF_MAX_DELAY = 600  # seconds
+
+# Device page data (name, serial, service date) rarely changes
+HTML_CACHE_TTL = 86400  # seconds
+
+# Connection pool settings (single upstream host)
+CONNECTION_LIMIT = 4
+CONNECTION_LIMIT_PER_HOST = 4
+DNS_CACHE_TTL = 900  # seconds, outlives the default polling interval
+KEEPALIVE_TIMEOUT = 75  # seconds
+
 # Device info
 MANUFACTURER = "BWT"
@@ -1,16 +1,33 @@
 """Data update coordinator for BWT MyService."""
+import asyncio
 from datetime import timedelta
+from functools import lru_cache
 import logging
 from typing import Any
 
+import aiohttp
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .api import BWTApiClient, AuthenticationError, ConnectionError as BWTConnectionError
-from .const import DOMAIN
+from .api import (
+    AuthenticationError,
+    BWTApiClient,
+    ConnectionError as BWTConnectionError,
+    DataNotFoundError,
+)
+from .const import DOMAIN, MANUFACTURER
 
 _LOGGER = logging.getLogger(__name__)
 
+# Lowercase device name markers mapped to the model they identify
+_MODEL_MARKERS: tuple[tuple[str, str], ...] = (
+    ("my perla", "MY PERLA OPTIMUM"),
+)
+
 
 class BWTDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Class to manage fetching BWT data from the API."""
@@ -20,6 +37,7 @@ class BWTDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         hass: HomeAssistant,
         api_client: BWTApiClient,
         update_interval: int,
+        entry: ConfigEntry,
     ) -> None:
         """Initialize the coordinator.
 
@@ -27,6 +45,7 @@ class BWTDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             hass: Home Assistant instance
             api_client: BWT API client
             update_interval: Update interval in minutes
+            entry: Config entry of the integration
         """
         super().__init__(
             hass,
@@ -35,6 +54,11 @@ class BWTDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=timedelta(minutes=update_interval),
         )
         self.api_client = api_client
+        self._entry = entry
+        # Built once from the first successful update and shared by all entities
+        self.device_info: DeviceInfo | None = None
+        # Data keys whose value changed with the last successful update
+        self.changed_keys: set[str] = set()
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from BWT API using persistent session.
@@ -45,20 +69,71 @@ class BWTDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Raises:
             UpdateFailed: If update fails
         """
+        # DataUpdateCoordinator logs UpdateFailed itself, so no extra logging here.
+        # Unexpected errors are left to the coordinator, which logs them with a traceback.
         try:
             _LOGGER.debug("Starting data update (using persistent session)")
             data = await self.api_client.get_device_data()
             _LOGGER.debug("Data update successful")
+
+            if self.device_info is None:
+                self.device_info = _build_device_info(data, self._entry)
+
+            # self.data still holds the previous result at this point
+            previous = self.data or {}
+            self.changed_keys = {
+                key
+                for key in data.keys() | previous.keys()
+                if data.get(key) != previous.get(key)
+            }
+
             return data
 
         except AuthenticationError as err:
-            _LOGGER.error("Authentication error: %s", err)
             raise UpdateFailed(f"Authentication failed: {err}") from err
 
         except BWTConnectionError as err:
-            _LOGGER.error("Connection error: %s", err)
             raise UpdateFailed(f"Connection error: {err}") from err
 
-        except Exception as err:
-            _LOGGER.error("Unexpected error updating data: %s", err)
+        except (DataNotFoundError, aiohttp.ClientError, asyncio.TimeoutError, ValueError) as err:
             raise UpdateFailed(f"Error updating data: {err}") from err
+
+
+def _build_device_info(data: dict[str, Any], entry: ConfigEntry) -> DeviceInfo:
+    """Build device info from coordinator data."""
+    device_name = data.get("device_name", "BWT Device")
+    serial_number = data.get("serial_number", "unknown")
+
+    model = _get_model(device_name)
+
+    # Get optional host for configuration_url
+    host = entry.data.get(CONF_HOST)
+
+    device_info = DeviceInfo(
+        identifiers={(DOMAIN, serial_number)},
+        name=device_name,
+        manufacturer=MANUFACTURER,
+        model=model,
+        serial_number=serial_number,
+    )
+
+    # Add configuration_url if host is provided
+    if host:
+        device_info["configuration_url"] = f"http://{host}"
+
+    return device_info
+
+
+@lru_cache(maxsize=8)
+def _get_model(device_name: str) -> str | None:
+    """Extract model from device name if possible."""
+    device_name_lower = device_name.lower()
+    for marker, model in _MODEL_MARKERS:
+        if marker in device_name_lower:
+            return model
+
+    # Use device name as model if it's not the default
+    if device_name and device_name != "BWT Device":
+        return device_name
+
+    return None
@@ -0,0 +1,64 @@
+"""Base entity for BWT MyService."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import EntityDescription
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .coordinator import BWTDataUpdateCoordinator
+
+
+@dataclass(frozen=True, kw_only=True)
+class BWTEntityDescription(EntityDescription):
+    """Describes a BWT entity backed by a coordinator data key."""
+
+    data_key: str
+
+
+class BWTEntity(CoordinatorEntity[BWTDataUpdateCoordinator]):
+    """Base class for BWT entities."""
+
+    entity_description: BWTEntityDescription
+    _attr_has_entity_name = True
+
+    def __init__(
+        self,
+        coordinator: BWTDataUpdateCoordinator,
+        description: BWTEntityDescription,
+        device_info: DeviceInfo,
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_device_info = device_info
+
+        # Set unique ID
+        serial_number = device_info.get("serial_number", "unknown")
+        self._attr_unique_id = f"{serial_number}_{description.key}"
+
+        self._last_update_success = coordinator.last_update_success
+        self._update_value()
+
+    def _update_value(self) -> None:
+        """Refresh values derived from coordinator data, if any."""
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator.
+
+        State is only written when this entity's data key changed or the
+        coordinator availability flipped.
+        """
+        last_update_success = self.coordinator.last_update_success
+        if (
+            last_update_success == self._last_update_success
+            and self.entity_description.data_key not in self.coordinator.changed_keys
+        ):
+            return
+
+        self._last_update_success = last_update_success
+        self._update_value()
+        super()._handle_coordinator_update()
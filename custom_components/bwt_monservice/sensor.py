@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import date, datetime
+from functools import lru_cache
 import logging
 from typing import Any
 
@@ -14,22 +15,50 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, UnitOfPressure, UnitOfVolume
+from homeassistant.const import UnitOfPressure, UnitOfVolume
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN, MANUFACTURER
+from .const import DOMAIN
 from .coordinator import BWTDataUpdateCoordinator
+from .entity import BWTEntity, BWTEntityDescription
 
 _LOGGER = logging.getLogger(__name__)
 
 
-@dataclass
-class BWTSensorEntityDescription(SensorEntityDescription):
+@dataclass(frozen=True, kw_only=True)
+class BWTSensorEntityDescription(SensorEntityDescription, BWTEntityDescription):
     """Describes BWT sensor entity."""
 
-    value_fn: Callable[[dict[str, Any]], Any] = lambda data: None
+    parse_fn: Callable[[Any], Any] | None = None
+
+
+@lru_cache(maxsize=32)
+def _parse_timestamp(value: str | None) -> datetime | None:
+    """Parse timestamp string to datetime object (memoized per raw string)."""
+    if not value:
+        return None
+
+    try:
+        # Try to parse ISO format (accepts a "Z" suffix on Python 3.11+)
+        return datetime.fromisoformat(value)
+    except (ValueError, AttributeError):
+        _LOGGER.debug("Failed to parse timestamp: %s", value)
+        return None
+
+
+@lru_cache(maxsize=32)
+def _parse_date(value: str | None) -> date | None:
+    """Parse date string to date object (memoized per raw string)."""
+    if not value:
+        return None
+
+    try:
+        # Try to parse ISO format (YYYY-MM-DD)
+        return date.fromisoformat(value)
+    except (ValueError, AttributeError):
+        _LOGGER.debug("Failed to parse date: %s", value)
+        return None
 
 
 SENSORS: tuple[BWTSensorEntityDescription, ...] = (
@@ -41,14 +70,14 @@ SENSORS: tuple[BWTSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.TOTAL,
         icon="mdi:water",
-        value_fn=lambda data: data.get("water_use"),
+        data_key="water_use",
     ),
     BWTSensorEntityDescription(
         key="regenerations_today",
         translation_key="regenerations_today",
         icon="mdi:refresh",
         state_class=SensorStateClass.TOTAL,
-        value_fn=lambda data: data.get("regen_count"),
+        data_key="regen_count",
     ),
     # Sensors from HTML device info section (working)
     BWTSensorEntityDescription(
@@ -56,20 +85,22 @@ SENSORS: tuple[BWTSensorEntityDescription, ...] = (
         translation_key="last_seen",
         device_class=SensorDeviceClass.TIMESTAMP,
         icon="mdi:clock-outline",
-        value_fn=lambda data: _parse_timestamp(data.get("last_seen")),
+        data_key="last_seen",
+        parse_fn=_parse_timestamp,
     ),
     BWTSensorEntityDescription(
         key="serial_number",
         translation_key="serial_number",
         icon="mdi:identifier",
-        value_fn=lambda data: data.get("serial_number"),
+        data_key="serial_number",
     ),
     BWTSensorEntityDescription(
         key="service_date",
         translation_key="service_date",
         device_class=SensorDeviceClass.DATE,
         icon="mdi:calendar",
-        value_fn=lambda data: _parse_date(data.get("service_date")),
+        data_key="service_date",
+        parse_fn=_parse_date,
     ),
     # Removed sensors (HTML params parsing no longer working due to website changes):
     # - hardness_in (Dureté d'entrée)
@@ -82,32 +113,6 @@ SENSORS: tuple[BWTSensorEntityDescription, ...] = (
 )
 
 
-def _parse_timestamp(value: str | None) -> datetime | None:
-    """Parse timestamp string to datetime object."""
-    if not value:
-        return None
-
-    try:
-        # Try to parse ISO format
-        return datetime.fromisoformat(value.replace("Z", "+00:00"))
-    except (ValueError, AttributeError):
-        _LOGGER.debug("Failed to parse timestamp: %s", value)
-        return None
-
-
-def _parse_date(value: str | None) -> date | None:
-    """Parse date string to date object."""
-    if not value:
-        return None
-
-    try:
-        # Try to parse ISO format (YYYY-MM-DD)
-        return date.fromisoformat(value)
-    except (ValueError, AttributeError):
-        _LOGGER.debug("Failed to parse date: %s", value)
-        return None
-
-
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -117,8 +122,8 @@ async def async_setup_entry(
     data = hass.data[DOMAIN][entry.entry_id]
     coordinator: BWTDataUpdateCoordinator = data["coordinator"]
 
-    # Create device info
-    device_info = _get_device_info(coordinator, entry)
+    # Device info is built once by the coordinator on its first refresh
+    device_info = coordinator.device_info
 
     # Create sensor entities
     entities = [
@@ -129,65 +134,20 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-def _get_device_info(coordinator: BWTDataUpdateCoordinator, entry: ConfigEntry) -> dict[str, Any]:
-    """Get device info from coordinator data."""
-    data = coordinator.data
-    device_name = data.get("device_name", "BWT Device")
-    serial_number = data.get("serial_number", "unknown")
-
-    # Extract model from device name if possible
-    model = None
-    if "MY PERLA" in device_name.upper():
-        model = "MY PERLA OPTIMUM"
-    elif device_name:
-        # Use device name as model if it's not the default
-        model = device_name if device_name != "BWT Device" else None
-
-    # Get optional host for configuration_url
-    host = entry.data.get(CONF_HOST)
-
-    device_info = {
-        "identifiers": {(DOMAIN, serial_number)},
-        "name": device_name,
-        "manufacturer": MANUFACTURER,
-        "model": model,
-        "serial_number": serial_number,
-    }
-
-    # Add configuration_url if host is provided
-    if host:
-        device_info["configuration_url"] = f"http://{host}"
-
-    return device_info
-
-
-class BWTSensor(CoordinatorEntity[BWTDataUpdateCoordinator], SensorEntity):
+class BWTSensor(BWTEntity, SensorEntity):
     """Representation of a BWT sensor."""
 
     entity_description: BWTSensorEntityDescription
 
-    def __init__(
-        self,
-        coordinator: BWTDataUpdateCoordinator,
-        description: BWTSensorEntityDescription,
-        device_info: dict[str, Any],
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator)
-        self.entity_description = description
-        self._attr_device_info = device_info
+    def _update_value(self) -> None:
+        """Compute the sensor value from coordinator data.
 
-        # Set unique ID
-        serial_number = device_info.get("serial_number", "unknown")
-        self._attr_unique_id = f"{serial_number}_{description.key}"
-
-        # Set entity ID
-        self._attr_has_entity_name = True
-
-    @property
-    def native_value(self) -> Any:
-        """Return the state of the sensor."""
-        return self.entity_description.value_fn(self.coordinator.data)
+        Runs once per coordinator update, not on every state read.
+        """
+        value = self.coordinator.data.get(self.entity_description.data_key)
+        if self.entity_description.parse_fn is not None:
+            value = self.entity_description.parse_fn(value)
+        self._attr_native_value = value
 
     @property
     def available(self) -> bool:
@@ -196,5 +156,4 @@ class BWTSensor(CoordinatorEntity[BWTDataUpdateCoordinator], SensorEntity):
             return False
 
         # Check if the value exists in coordinator data
-        value = self.entity_description.value_fn(self.coordinator.data)
-        return value is not None
+        return self._attr_native_value is not None